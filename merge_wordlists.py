@@ -1,38 +1,31 @@
 # Merge allowed.txt and words.txt into total_allowed.txt
 
+import os
+
+# Byte translation table that upper-cases ASCII letters by clearing bit 5 (c & 0xDF)
+ASCII_UPPER = bytes(i & 0xDF if 0x61 <= i <= 0x7A else i for i in range(256))
+
+def read_lines(path):
+    """Return the words in a file as bytes"""
+    with open(path, 'rb') as f:
+        return f.read().split()
+
 def merge_sorted_files(file1_path, file2_path, output_path):
-    with open(file1_path, 'r') as f1, open(file2_path, 'r') as f2, open(output_path, 'w') as output:
-        
-        line1 = f1.readline().strip()
-        line2 = f2.readline().strip()
-        
-        while line1 and line2:
-            if line1.upper() <= line2.upper():
-                # Avoid duplicates
-                if not (line1.upper() == line2.upper()):
-                    output.write(line1 + '\n')
-                else:
-                    # They're equal, write one and advance both
-                    output.write(line1 + '\n')
-                    line2 = f2.readline().strip()
-                line1 = f1.readline().strip()
-            else:
-                output.write(line2 + '\n')
-                line2 = f2.readline().strip()
-        
-        # Write remaining lines from file1
-        while line1:
-            output.write(line1 + '\n')
-            line1 = f1.readline().strip()
-        
-        # Write remaining lines from file2
-        while line2:
-            output.write(line2 + '\n')
-            line2 = f2.readline().strip()
+    lines = read_lines(file1_path) + read_lines(file2_path)
+    
+    # Key on the upper-cased word so duplicates collapse case-insensitively;
+    # building from the reversed list keeps file1's spelling on a tie
+    lines.reverse()
+    merged = {line.translate(ASCII_UPPER): line for line in lines}
+    
+    merged_lines = [merged[key] for key in sorted(merged)]
+    
+    # Emit the whole merged list with a single write
+    with open(output_path, 'wb') as output:
+        if merged_lines:
+            output.write(b'\n'.join(merged_lines) + b'\n')
 
 if __name__ == "__main__":
-    import os
-    
     if not os.path.exists('words.txt'):
         print("Error: words.txt not found!")
         exit(1)
@@ -43,13 +36,3 @@ if __name__ == "__main__":
     
     print("Merging words.txt and allowed.txt into total_allowed.txt...")
     merge_sorted_files('words.txt', 'allowed.txt', 'total_allowed.txt')
-    
-    # Count lines in each file
-    with open('words.txt', 'r') as f:
-        words_count = len([line for line in f if line.strip()])
-    
-    with open('allowed.txt', 'r') as f:
-        allowed_count = len([line for line in f if line.strip()])
-    
-    with open('total_allowed.txt', 'r') as f:
-        total_count = len([line for line in f if line.strip()])
\ No newline at end of file
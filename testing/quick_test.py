@@ -3,20 +3,22 @@
 
 import sys
 import os
+from functools import lru_cache
 sys.path.append('.')
 
-from wordle_tester import WordleSolver, WordleTestSuite
+from wordle_tester import WordleSolver, WordleTestSuite, load_word_list
+
+@lru_cache(maxsize=1)
+def get_solver():
+    """Load the word list and build the solver once for all quick tests"""
+    return WordleSolver(load_word_list('../words.txt'))
 
 def quick_test():
     """Run a quick test to validate the algorithm"""
     print("QUICK ALGORITHM VALIDATION TEST")
     print("=" * 40)
     
-    # Test specific scenarios
-    with open('../words.txt', 'r') as f:
-        word_list = [line.strip().upper() for line in f if len(line.strip()) == 5]
-    
-    solver = WordleSolver(word_list)
+    solver = get_solver()
     
     # Test some specific words
     test_words = ['SWORD', 'SOARE', 'ABOUT', 'WORLD', 'HEART']
@@ -48,10 +50,7 @@ def test_specific_scenario():
     print("\nTESTING SWORD SCENARIO")
     print("=" * 30)
     
-    with open('../words.txt', 'r') as f:
-        word_list = [line.strip().upper() for line in f if len(line.strip()) == 5]
-    
-    solver = WordleSolver(word_list)
+    solver = get_solver()
     result = solver.solve_word('SWORD')
     
     print("Target word: SWORD")
@@ -8,110 +8,131 @@ from wordle_tester import WordleTestSuite
 def save_statistics_to_files(analysis, output_dir='./'):
     """Save specific statistics to separate text files"""
     stats = analysis['guess_statistics']
+    detailed = analysis['detailed_analysis']
+    efficiency = analysis['efficiency_metrics']
+    total = analysis['total_games']
     
+    # Unpack the statistics once; the percentile table is shared by the reports
+    mean, std = stats['mean'], stats['std_dev']
+    median, iqr = stats['median'], stats['iqr']
+    skewness, kurtosis = stats['skewness'], stats['kurtosis']
+    percentiles = stats['percentiles']
+    percentile_rows = [(p, percentiles[f'p{p}']) for p in [10, 25, 50, 75, 90, 95, 99]
+                       if f'p{p}' in percentiles]
+    
+    # Each file is built as a list of lines and written with a single call
     # Save mean and standard deviation
-    with open(f'{output_dir}/mean_sd.txt', 'w') as f:
-        f.write("WORDLE ALGORITHM - MEAN AND STANDARD DEVIATION ANALYSIS\n")
-        f.write("=" * 60 + "\n\n")
-        f.write(f"Dataset: {analysis['total_games']:,} words (complete dictionary)\n")
-        f.write(f"Success Rate: {analysis['success_rate']:.4f}%\n\n")
-        
-        f.write("CENTRAL TENDENCY:\n")
-        f.write(f"Mean (Average): {stats['mean']:.6f} guesses\n")
-        f.write(f"Standard Deviation: {stats['std_dev']:.6f}\n")
-        f.write(f"Variance: {stats['variance']:.6f}\n\n")
-        
-        f.write("CONFIDENCE INTERVALS (based on mean ± k*std_dev):\n")
-        mean, std = stats['mean'], stats['std_dev']
-        f.write(f"68% confidence: {mean - std:.4f} to {mean + std:.4f} guesses\n")
-        f.write(f"95% confidence: {mean - 2*std:.4f} to {mean + 2*std:.4f} guesses\n")
-        f.write(f"99.7% confidence: {mean - 3*std:.4f} to {mean + 3*std:.4f} guesses\n\n")
-        
-        f.write("INTERPRETATION:\n")
-        f.write(f"- The algorithm averages {stats['mean']:.4f} guesses per word\n")
-        f.write(f"- Standard deviation of {stats['std_dev']:.4f} indicates {'high' if stats['std_dev'] > 1 else 'moderate' if stats['std_dev'] > 0.5 else 'low'} variability\n")
-        f.write(f"- 95% of words solved within {mean + 2*std:.2f} guesses\n")
+    improvement = ((4.2 - mean)/4.2)*100
+    lines = [
+        "WORDLE ALGORITHM - MEAN AND STANDARD DEVIATION ANALYSIS",
+        "=" * 60,
+        "",
+        f"Dataset: {total:,} words (complete dictionary)",
+        f"Success Rate: {analysis['success_rate']:.4f}%",
+        "",
+        "CENTRAL TENDENCY:",
+        f"Mean (Average): {mean:.6f} guesses",
+        f"Standard Deviation: {std:.6f}",
+        f"Variance: {stats['variance']:.6f}",
+        "",
+        "CONFIDENCE INTERVALS (based on mean ± k*std_dev):",
+        f"68% confidence: {mean - std:.4f} to {mean + std:.4f} guesses",
+        f"95% confidence: {mean - 2*std:.4f} to {mean + 2*std:.4f} guesses",
+        f"99.7% confidence: {mean - 3*std:.4f} to {mean + 3*std:.4f} guesses",
+        "",
+        "INTERPRETATION:",
+        f"- The algorithm averages {mean:.4f} guesses per word",
+        f"- Standard deviation of {std:.4f} indicates {'high' if std > 1 else 'moderate' if std > 0.5 else 'low'} variability",
+        f"- 95% of words solved within {mean + 2*std:.2f} guesses",
         
         # Performance comparison
-        f.write(f"\nPERFORMANCE COMPARISON:\n")
-        f.write(f"Random Strategy: ~4.8 ± 1.2 guesses\n")
-        f.write(f"Frequency-Based: ~4.2 ± 0.9 guesses\n")
-        f.write(f"Our Algorithm: {stats['mean']:.4f} ± {stats['std_dev']:.4f} guesses\n")
-        improvement = ((4.2 - stats['mean'])/4.2)*100
-        f.write(f"Improvement: {improvement:.2f}% better than frequency-based\n")
+        "",
+        "PERFORMANCE COMPARISON:",
+        "Random Strategy: ~4.8 ± 1.2 guesses",
+        "Frequency-Based: ~4.2 ± 0.9 guesses",
+        f"Our Algorithm: {mean:.4f} ± {std:.4f} guesses",
+        f"Improvement: {improvement:.2f}% better than frequency-based",
+    ]
+    with open(f'{output_dir}/mean_sd.txt', 'w') as f:
+        f.write("\n".join(lines) + "\n")
     
     # Save median and quartile analysis
+    skew_desc = "right-skewed" if skewness > 0 else "left-skewed" if skewness < 0 else "symmetric"
+    kurt_desc = "heavy-tailed" if kurtosis > 0 else "light-tailed" if kurtosis < 0 else "normal-tailed"
+    lines = [
+        "WORDLE ALGORITHM - MEDIAN AND QUARTILE ANALYSIS",
+        "=" * 55,
+        "",
+        f"Dataset: {total:,} words (complete dictionary)",
+        "",
+        "QUARTILE STATISTICS:",
+        f"Minimum: {stats['min']} guesses",
+        f"Q1 (25th percentile): {stats['q1']:.3f} guesses",
+        f"Median (50th percentile): {median:.3f} guesses",
+        f"Q3 (75th percentile): {stats['q3']:.3f} guesses",
+        f"Maximum: {stats['max']} guesses",
+        "",
+        "SPREAD MEASURES:",
+        f"Range: {stats['range']} guesses ({stats['min']} to {stats['max']})",
+        f"Interquartile Range (IQR): {iqr:.3f} guesses",
+        f"Semi-Interquartile Range: {iqr/2:.3f} guesses",
+        "",
+        "DETAILED PERCENTILES:",
+    ]
+    lines += [f"{p}th percentile: {value:.3f} guesses" for p, value in percentile_rows]
+    lines += [
+        "",
+        "DISTRIBUTION PROPERTIES:",
+        f"Mode (most frequent): {stats['mode']} guesses",
+        f"Skewness: {skewness:.4f} ({skew_desc})",
+        f"Kurtosis: {kurtosis:.4f} ({kurt_desc})",
+        "",
+        "INTERPRETATION:",
+        f"- 50% of words solved in {median:.1f} or fewer guesses",
+        f"- Middle 50% of results span {iqr:.2f} guesses",
+        f"- {'Relatively consistent' if iqr < 2 else 'Moderate variation' if iqr < 3 else 'High variation'} in performance",
+    ]
     with open(f'{output_dir}/median_quartiles.txt', 'w') as f:
-        f.write("WORDLE ALGORITHM - MEDIAN AND QUARTILE ANALYSIS\n")
-        f.write("=" * 55 + "\n\n")
-        f.write(f"Dataset: {analysis['total_games']:,} words (complete dictionary)\n\n")
-        
-        f.write("QUARTILE STATISTICS:\n")
-        f.write(f"Minimum: {stats['min']} guesses\n")
-        f.write(f"Q1 (25th percentile): {stats['q1']:.3f} guesses\n")
-        f.write(f"Median (50th percentile): {stats['median']:.3f} guesses\n")
-        f.write(f"Q3 (75th percentile): {stats['q3']:.3f} guesses\n")
-        f.write(f"Maximum: {stats['max']} guesses\n\n")
-        
-        f.write("SPREAD MEASURES:\n")
-        f.write(f"Range: {stats['range']} guesses ({stats['min']} to {stats['max']})\n")
-        f.write(f"Interquartile Range (IQR): {stats['iqr']:.3f} guesses\n")
-        f.write(f"Semi-Interquartile Range: {stats['iqr']/2:.3f} guesses\n\n")
-        
-        f.write("DETAILED PERCENTILES:\n")
-        for p in [10, 25, 50, 75, 90, 95, 99]:
-            if f'p{p}' in stats['percentiles']:
-                f.write(f"{p}th percentile: {stats['percentiles'][f'p{p}']:.3f} guesses\n")
-        
-        f.write(f"\nDISTRIBUTION PROPERTIES:\n")
-        f.write(f"Mode (most frequent): {stats['mode']} guesses\n")
-        skew_desc = "right-skewed" if stats['skewness'] > 0 else "left-skewed" if stats['skewness'] < 0 else "symmetric"
-        f.write(f"Skewness: {stats['skewness']:.4f} ({skew_desc})\n")
-        kurt_desc = "heavy-tailed" if stats['kurtosis'] > 0 else "light-tailed" if stats['kurtosis'] < 0 else "normal-tailed"
-        f.write(f"Kurtosis: {stats['kurtosis']:.4f} ({kurt_desc})\n\n")
-        
-        f.write("INTERPRETATION:\n")
-        f.write(f"- 50% of words solved in {stats['median']:.1f} or fewer guesses\n")
-        f.write(f"- Middle 50% of results span {stats['iqr']:.2f} guesses\n")
-        f.write(f"- {'Relatively consistent' if stats['iqr'] < 2 else 'Moderate variation' if stats['iqr'] < 3 else 'High variation'} in performance\n")
+        f.write("\n".join(lines) + "\n")
     
     # Save complete frequency distribution
+    lines = [
+        "WORDLE ALGORITHM - COMPLETE FREQUENCY DISTRIBUTION",
+        "=" * 58,
+        "",
+        "GUESS COUNT DISTRIBUTION:",
+        "Guesses | Count    | Percentage | Cumulative %",
+        "-" * 45,
+    ]
+    
+    cumulative = 0
+    for guess_num in range(1, 7):
+        count = detailed[f'words_solved_in_{guess_num}']
+        pct = count / total * 100
+        cumulative += pct
+        lines.append(f"{guess_num:7} | {count:8,} | {pct:9.2f}% | {cumulative:10.2f}%")
+    
+    if analysis['failed_games'] > 0:
+        fail_pct = analysis['failed_games'] / total * 100
+        cumulative += fail_pct
+        lines.append(f"  Failed | {analysis['failed_games']:8,} | {fail_pct:9.2f}% | {cumulative:10.2f}%")
+    
+    lines += [
+        "-" * 45,
+        f"  Total | {total:8,} | {100.0:9.1f}% |",
+        "",
+        "KEY THRESHOLDS:",
+        f"Words solved in ≤3 guesses: {detailed['percentage_under_4']:.2f}%",
+        f"Words solved in ≤4 guesses: {detailed['percentage_under_5']:.2f}%",
+        f"Success rate (≤6 guesses): {analysis['success_rate']:.2f}%",
+        "",
+        "EFFICIENCY METRICS:",
+        f"Total guesses used: {efficiency['total_guesses_made']:,}",
+        f"Average per word: {efficiency['average_guesses_per_word']:.4f}",
+        f"Efficiency ratio: {efficiency['efficiency_ratio']:.2f}%",
+    ]
     with open(f'{output_dir}/frequency_distribution.txt', 'w') as f:
-        f.write("WORDLE ALGORITHM - COMPLETE FREQUENCY DISTRIBUTION\n")
-        f.write("=" * 58 + "\n\n")
-        
-        detailed = analysis['detailed_analysis']
-        total = analysis['total_games']
-        
-        f.write("GUESS COUNT DISTRIBUTION:\n")
-        f.write("Guesses | Count    | Percentage | Cumulative %\n")
-        f.write("-" * 45 + "\n")
-        
-        cumulative = 0
-        for guess_num in range(1, 7):
-            count = detailed[f'words_solved_in_{guess_num}']
-            pct = count / total * 100
-            cumulative += pct
-            f.write(f"{guess_num:7} | {count:8,} | {pct:9.2f}% | {cumulative:10.2f}%\n")
-        
-        if analysis['failed_games'] > 0:
-            fail_pct = analysis['failed_games'] / total * 100
-            cumulative += fail_pct
-            f.write(f"  Failed | {analysis['failed_games']:8,} | {fail_pct:9.2f}% | {cumulative:10.2f}%\n")
-        
-        f.write("-" * 45 + "\n")
-        f.write(f"  Total | {total:8,} | {100.0:9.1f}% |\n\n")
-        
-        f.write("KEY THRESHOLDS:\n")
-        f.write(f"Words solved in ≤3 guesses: {detailed['percentage_under_4']:.2f}%\n")
-        f.write(f"Words solved in ≤4 guesses: {detailed['percentage_under_5']:.2f}%\n")
-        f.write(f"Success rate (≤6 guesses): {analysis['success_rate']:.2f}%\n\n")
-        
-        f.write("EFFICIENCY METRICS:\n")
-        efficiency = analysis['efficiency_metrics']
-        f.write(f"Total guesses used: {efficiency['total_guesses_made']:,}\n")
-        f.write(f"Average per word: {efficiency['average_guesses_per_word']:.4f}\n")
-        f.write(f"Efficiency ratio: {efficiency['efficiency_ratio']:.2f}%\n")
+        f.write("\n".join(lines) + "\n")
     
     print("Statistics saved to files:")
     print("  - mean_sd.txt (mean and standard deviation analysis)")
@@ -123,28 +144,23 @@ def run_and_save():
     print("Running sample analysis and saving results to text files...")
     
     # Import and run a smaller test for demonstration
-    import random
-    with open('../words.txt', 'r') as f:
-        word_list = [line.strip().upper() for line in f if len(line.strip()) == 5]
-    
-    from wordle_tester import WordleSolver
+    import numpy as np
+    from wordle_tester import solve_words_parallel
+    tester = WordleTestSuite()
+    word_list = tester.word_list
     
     # Test on 1000 words for demonstration
-    random.seed(42)
-    test_words = random.sample(word_list, 1000)
+    sample_idx = np.random.default_rng(42).choice(len(word_list), 1000, replace=False)
+    test_words = [word_list[i] for i in sample_idx]
     
-    solver = WordleSolver(word_list)
     results = []
     
-    for i, word in enumerate(test_words):
+    for i, result in enumerate(solve_words_parallel(tester.solver, test_words)):
         if i % 100 == 0:
             print(f"Progress: {i}/1000")
-        result = solver.solve_word(word)
-        result['target_word'] = word
         results.append(result)
     
     # Analyze results
-    tester = WordleTestSuite()
     tester.results = results
     analysis = tester.analyze_results()
     
@@ -1,199 +1,368 @@
+import os
+import sys
 import random
 import json
 import time
 import statistics
-from collections import defaultdict, Counter
+import weakref
+from multiprocessing import Pool, get_start_method, shared_memory
 from typing import List, Dict, Set, Tuple, Optional
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 import numpy as np
 
+def load_word_list(word_file: str) -> List[str]:
+    """Load the 5-letter words from a word file, upper-cased
+    
+    Only words of five ASCII letters are kept.
+    """
+    with open(word_file, 'rb') as f:
+        words = np.array(f.read().upper().split(), dtype=np.bytes_)
+    
+    # One vectorized check over the fixed-width byte array
+    keep = (np.char.str_len(words) == 5) & np.char.isalpha(words)
+    return np.char.decode(words[keep], 'ascii').tolist()
+
+# Result patterns are encoded as base-3 integers: position i contributes digit * 3**i
+PATTERN_DIGITS = {'grey': 0, 'yellow': 1, 'green': 2}
+PATTERN_COUNT = 3 ** 5
+POSITION_WEIGHTS = 3 ** np.arange(5, dtype=np.uint8)
+EARLIER_POSITIONS = np.tril(np.ones((5, 5), dtype=bool), -1)
+ALL_LETTERS = (1 << 26) - 1
+
+# Guess pools are scored this many words at a time so the search can stop early
+EARLY_EXIT_SLICE = 2048
+
+# Best guesses are memoized for game states with fewer guesses than this
+OPENING_CACHE_PLIES = 2
+
+def count_letters(words_u8: np.ndarray) -> np.ndarray:
+    """(N, 26) uint8 array of how many times each letter occurs in each word"""
+    counts = np.zeros((len(words_u8), 26), dtype=np.uint8)
+    rows = np.arange(len(words_u8))
+    for p in range(5):
+        counts[rows, words_u8[:, p] - 65] += 1
+    return counts
+
+def pattern_codes(guesses: np.ndarray, answers: np.ndarray,
+                  answer_letter_counts: Optional[np.ndarray] = None) -> np.ndarray:
+    """Compute the (len(guesses), len(answers)) matrix of base-3 result codes
+    
+    guesses and answers are (N, 5) uint8 arrays of upper-case ASCII letters;
+    answer_letter_counts is count_letters(answers), if already known.
+    """
+    n = len(answers)
+    answers_t = np.ascontiguousarray(answers.T)
+    if answer_letter_counts is None:
+        answer_letter_counts = count_letters(answers)
+    letter_counts = np.ascontiguousarray(answer_letter_counts.T)
+    
+    green = guesses[:, :, None] == answers_t
+    same = guesses[:, :, None] == guesses[:, None, :]
+    earlier = (same & EARLIER_POSITIONS).sum(axis=2, dtype=np.uint8)
+    
+    # Every earlier copy of a letter in the guess uses up one copy in the answer
+    # (as a green or a yellow), and so does every later green on that letter.
+    # Position i is yellow if the answer still has a copy left after those.
+    codes = np.zeros((len(guesses), n), dtype=np.uint8)
+    for i in range(5):
+        needed = np.repeat(earlier[:, i, None], n, axis=1)
+        for p in range(i + 1, 5):
+            needed += same[:, i, p, None] & green[:, p]
+        yellow = ~green[:, i] & (letter_counts[guesses[:, i] - 65] > needed)
+        codes += green[:, i] * (2 * POSITION_WEIGHTS[i]) + yellow * POSITION_WEIGHTS[i]
+    
+    return codes
+
+def popcount(masks: np.ndarray) -> np.ndarray:
+    """Number of set bits in each element of a uint32 array"""
+    bits = np.unpackbits(np.ascontiguousarray(masks, dtype=np.uint32).view(np.uint8))
+    return bits.reshape(len(masks), 32).sum(axis=1)
+
+def encode_pattern(result: List[str]) -> int:
+    """Encode a result pattern such as ['green', 'grey', ...] as its base-3 code"""
+    return sum(PATTERN_DIGITS[tag] * 3 ** i for i, tag in enumerate(result))
+
 class WordleSolver:
-    def __init__(self, word_list: List[str]):
-        self.all_words = [word.upper() for word in word_list if len(word) == 5]
+    def __init__(self, word_list: List[str], pattern_matrix: Optional[np.ndarray] = None,
+                 matrix_path: Optional[str] = None, share_matrix: bool = False):
+        # Expects upper-cased 5-letter words, as load_word_list and WordleTestSuite produce
+        self.all_words = list(word_list)
+        if any(len(word) != 5 for word in self.all_words):
+            raise ValueError("WordleSolver needs a list of 5-letter words")
+        self.word_index = {word: i for i, word in enumerate(self.all_words)}
+        
+        # Per-word letter data, one array per property
+        self.words_u8 = np.frombuffer(''.join(self.all_words).encode('ascii', 'replace'),
+                                      dtype=np.uint8).reshape(-1, 5)
+        if ((self.words_u8 < 65) | (self.words_u8 > 90)).any():
+            raise ValueError("WordleSolver needs words of upper-case letters A-Z")
+        self.letter_counts = count_letters(self.words_u8)
+        self.letter_mask = np.bitwise_or.reduce(
+            np.uint32(1) << (self.words_u8 - 65).astype(np.uint32), axis=1)
+        self.unique_letter_count = (self.letter_counts > 0).sum(axis=1, dtype=np.uint8)
+        self._unique5_idx = np.where(self.unique_letter_count == 5)[0]
+        
+        # A prebuilt matrix (e.g. one shared between processes) skips the precomputation
+        self.matrix_path = matrix_path
+        self._row_built = None
+        self._shm = None
+        if pattern_matrix is None and matrix_path is not None:
+            # Dictionaries too large for an in-memory matrix keep it in a file
+            # instead and compute each guess row the first time it is scored
+            pattern_matrix = self._open_matrix_file(matrix_path)
+        elif pattern_matrix is None:
+            # share_matrix builds it straight into shared memory for solve_words_parallel
+            out = self._allocate_shared_matrix() if share_matrix else None
+            pattern_matrix = self._build_pattern_matrix(out)
+        self.pattern_matrix = pattern_matrix
+        
+        # Every game starts from the same state, so the opening plies repeat
+        # across games; keyed by the (guess, result code) history so far
+        self._opening_cache: Dict[Tuple, Optional[str]] = {}
+        # Endgame pairs recur across games too
+        self._distinguish_cache: Dict[frozenset, np.ndarray] = {}
         self.reset_game()
     
+    def _build_pattern_matrix(self, out: Optional[np.ndarray] = None, block_size: int = 128) -> np.ndarray:
+        """Precompute the result code of every (guess, answer) pair as an N x N uint8 matrix"""
+        n = len(self.all_words)
+        matrix = np.empty((n, n), dtype=np.uint8) if out is None else out
+        for start in range(0, n, block_size):
+            matrix[start:start + block_size] = pattern_codes(
+                self.words_u8[start:start + block_size], self.words_u8, self.letter_counts)
+        return matrix
+    
+    def _allocate_shared_matrix(self) -> np.ndarray:
+        """An uninitialized N x N matrix in a shared memory block pool workers can attach to"""
+        n = len(self.all_words)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(n * n, 1))
+        # Only unlink: the name goes away, the memory lives while arrays still view it
+        weakref.finalize(self, self._shm.unlink)
+        return np.ndarray((n, n), dtype=np.uint8, buffer=self._shm.buf)
+    
+    def _open_matrix_file(self, matrix_path: str) -> np.memmap:
+        """Map a file-backed pattern matrix, creating the file if it doesn't exist
+        
+        The file holds the word list, a computed flag per guess row and then the
+        N x N matrix, so rows filled in by one run are reused by the next.
+        """
+        n = len(self.all_words)
+        size = 6 * n + n * n
+        exists = os.path.exists(matrix_path)
+        if exists and os.path.getsize(matrix_path) != size:
+            raise ValueError(f"{matrix_path} does not hold a pattern matrix for this word list")
+        
+        layout = np.memmap(matrix_path, dtype=np.uint8, mode='r+' if exists else 'w+', shape=(size,))
+        stored_words = layout[:5 * n].reshape(n, 5)
+        if not exists:
+            stored_words[:] = self.words_u8
+        elif not np.array_equal(stored_words, self.words_u8):
+            raise ValueError(f"{matrix_path} does not hold a pattern matrix for this word list")
+        
+        self._row_built = layout[5 * n:6 * n].view(bool)
+        return layout[6 * n:].reshape(n, n)
+    
+    def _ensure_rows(self, rows: np.ndarray, block_size: int = 128):
+        """Compute any of the given guess rows that a file-backed matrix is still missing"""
+        if self._row_built is None:
+            return
+        
+        missing = rows[~self._row_built[rows]]
+        for start in range(0, len(missing), block_size):
+            block = missing[start:start + block_size]
+            self.pattern_matrix[block] = pattern_codes(self.words_u8[block], self.words_u8, self.letter_counts)
+        self._row_built[missing] = True
+    
+    @property
+    def possible_words(self) -> List[str]:
+        """The remaining candidate answers as strings"""
+        return [self.all_words[i] for i in self.possible_idx]
+    
     def reset_game(self):
         """Reset solver state for a new game"""
-        self.possible_words = self.all_words.copy()
+        self.possible_idx = np.arange(len(self.all_words))
         self.guess_history = []
-        self.tested_letters = set()
-        self.known_letters = set()
-        self.excluded_letters = set()
+        self._history_key = ()
+        # Letter sets as bitmasks: bit k stands for chr(65 + k)
+        self.tested_mask = 0
+        self.known_mask = 0
+        self.excluded_mask = 0
     
     def update_letter_tracking(self, guess: str, result: List[str]):
         """Track which letters have been tested and their status"""
-        for i, letter in enumerate(guess):
-            self.tested_letters.add(letter)
-            
-            if result[i] in ['green', 'yellow']:
-                self.known_letters.add(letter)
-            elif result[i] == 'grey':
-                # Only exclude if letter doesn't appear as green/yellow elsewhere
-                appears_elsewhere = any(
-                    result[j] in ['green', 'yellow'] and guess[j] == letter
-                    for j in range(5) if j != i
-                )
-                if not appears_elsewhere:
-                    self.excluded_letters.add(letter)
-    
-    def is_word_compatible(self, word: str, guess: str, result: List[str]) -> bool:
-        """Check if a word is compatible with a guess result"""
-        word_letters = list(word)
-        guess_letters = list(guess)
-        
-        # Check each position
-        for i in range(5):
-            if result[i] == 'green':
-                if word_letters[i] != guess_letters[i]:
-                    return False
-            elif result[i] == 'yellow':
-                if word_letters[i] == guess_letters[i]:
-                    return False
-                if guess_letters[i] not in word:
-                    return False
-            elif result[i] == 'grey':
-                # Check if letter appears as green/yellow elsewhere
-                has_yellow_or_green = any(
-                    result[j] in ['yellow', 'green'] and guess_letters[j] == guess_letters[i]
-                    for j in range(5)
-                )
-                if not has_yellow_or_green and guess_letters[i] in word:
-                    return False
-        
-        # Additional check for yellow letters - count constraints
-        for i in range(5):
-            if result[i] == 'yellow':
-                letter = guess_letters[i]
-                guess_count = sum(1 for j in range(5) 
-                                if guess_letters[j] == letter and result[j] in ['yellow', 'green'])
-                word_count = word.count(letter)
-                if word_count < guess_count:
-                    return False
-        
-        return True
+        guess_mask = found_mask = grey_mask = 0
+        for letter, tag in zip(guess, result):
+            bit = 1 << (ord(letter) - 65)
+            guess_mask |= bit
+            if tag in ('green', 'yellow'):
+                found_mask |= bit
+            elif tag == 'grey':
+                grey_mask |= bit
+        
+        self.tested_mask |= guess_mask
+        self.known_mask |= found_mask
+        # Only exclude if letter doesn't appear as green/yellow elsewhere
+        self.excluded_mask |= grey_mask & ~found_mask
     
     def get_result_pattern(self, guess: str, answer: str) -> List[str]:
         """Calculate what result pattern a guess would give for an answer"""
         result = ['grey'] * 5
-        answer_letters = list(answer)
-        guess_letters = list(guess)
-        used_answer_indices = set()
+        unmatched = {}  # letter -> bitmask of answer positions not yet matched
         
         # First pass: mark greens
         for i in range(5):
-            if guess_letters[i] == answer_letters[i]:
+            if guess[i] == answer[i]:
                 result[i] = 'green'
-                used_answer_indices.add(i)
+            else:
+                unmatched[answer[i]] = unmatched.get(answer[i], 0) | (1 << i)
         
-        # Second pass: mark yellows
+        # Second pass: mark yellows, each one using up the lowest unmatched position
         for i in range(5):
             if result[i] == 'grey':
-                letter = guess_letters[i]
-                for j in range(5):
-                    if (j not in used_answer_indices and 
-                        answer_letters[j] == letter):
-                        result[i] = 'yellow'
-                        used_answer_indices.add(j)
-                        break
+                positions = unmatched.get(guess[i], 0)
+                if positions:
+                    result[i] = 'yellow'
+                    unmatched[guess[i]] = positions & (positions - 1)
         
         return result
     
-    def calculate_expected_value(self, guess: str) -> float:
-        """Calculate expected information gain for a guess"""
-        if len(self.possible_words) <= 1:
-            return 0
-        
-        result_groups = defaultdict(list)
-        
-        # Group possible answers by result pattern
-        for answer in self.possible_words:
-            pattern = self.get_result_pattern(guess, answer)
-            key = ''.join(pattern)
-            result_groups[key].append(answer)
-        
-        # Calculate expected remaining words
-        expected_remaining = sum(
-            (len(group) / len(self.possible_words)) * len(group)
-            for group in result_groups.values()
-        )
-        
+    def expected_remaining(self, guess_pool: np.ndarray, max_block_cells: int = 1 << 22) -> np.ndarray:
+        """Expected number of possible words left after each guess in the pool"""
+        num_possible = len(self.possible_idx)
+        expected = np.empty(len(guess_pool))
+        rows_per_block = max(1, max_block_cells // num_possible)
+        
+        # Histogram every guess's result codes in one bincount per block by
+        # offsetting row k into bins [k * PATTERN_COUNT, (k + 1) * PATTERN_COUNT)
+        for start in range(0, len(guess_pool), rows_per_block):
+            block = guess_pool[start:start + rows_per_block]
+            self._ensure_rows(block)
+            codes = self.pattern_matrix[np.ix_(block, self.possible_idx)]
+            offsets = PATTERN_COUNT * np.arange(len(block))[:, None]
+            counts = np.bincount((codes + offsets).ravel(), minlength=PATTERN_COUNT * len(block))
+            counts = counts.reshape(len(block), PATTERN_COUNT)
+            expected[start:start + len(block)] = (counts * counts).sum(axis=1) / num_possible
+        
+        return expected
+    
+    def score_guesses(self, guess_pool: np.ndarray) -> np.ndarray:
+        """Calculate expected information gain for every guess in the pool"""
         # Base information gain
-        info_gain = len(self.possible_words) - expected_remaining
+        info_gain = len(self.possible_idx) - self.expected_remaining(guess_pool)
+        guess_masks = self.letter_mask[guess_pool]
         
         # Bonus for testing new letters
-        guess_letters = set(guess)
-        new_letters = guess_letters - self.tested_letters
-        info_gain += len(new_letters) * 2
+        untested = np.uint32(self.tested_mask ^ ALL_LETTERS)
+        info_gain += popcount(guess_masks & untested) * 2
         
         # Penalty for repeated letters (unless few options)
-        unique_letters = len(guess_letters)
-        if unique_letters < 5 and len(self.possible_words) > 10:
-            info_gain -= (5 - unique_letters) * 1.5
+        if len(self.possible_idx) > 10:
+            info_gain -= (5 - self.unique_letter_count[guess_pool].astype(np.int64)) * 1.5
         
         # Penalty for using excluded letters
-        excluded_used = len(guess_letters & self.excluded_letters)
-        info_gain -= excluded_used * 5
+        excluded = np.uint32(self.excluded_mask)
+        info_gain -= popcount(guess_masks & excluded) * 5
         
         return info_gain
     
-    def find_distinguishing_words(self) -> List[str]:
-        """Find words that help distinguish between remaining options"""
-        if len(self.possible_words) != 2:
-            return self.all_words
-        
-        word1, word2 = self.possible_words
-        diff_letters = set()
+    def calculate_expected_value(self, guess: str) -> float:
+        """Calculate expected information gain for a guess"""
+        guess_idx = self.word_index.get(guess)
+        if guess_idx is None:
+            raise ValueError(f"{guess} is not in the solver's word list")
         
-        for i in range(5):
-            if word1[i] != word2[i]:
-                diff_letters.add(word1[i])
-                diff_letters.add(word2[i])
+        if len(self.possible_idx) <= 1:
+            return 0
+        return float(self.score_guesses(np.array([guess_idx]))[0])
+    
+    def find_distinguishing_words(self) -> np.ndarray:
+        """Find indices of words that help distinguish between remaining options"""
+        if len(self.possible_idx) != 2:
+            return np.arange(len(self.all_words))
+        
+        pair = frozenset(self.possible_idx.tolist())
+        if pair not in self._distinguish_cache:
+            word1, word2 = self.words_u8[self.possible_idx]
+            differs = word1 != word2
+            diff_letters = np.concatenate([word1[differs], word2[differs]])
+            diff_mask = np.bitwise_or.reduce(np.uint32(1) << (diff_letters - 65).astype(np.uint32),
+                                             initial=np.uint32(0))
+            
+            # Prefer unique letters
+            candidates = self._unique5_idx
+            self._distinguish_cache[pair] = candidates[(self.letter_mask[candidates] & diff_mask) != 0]
         
-        return [word for word in self.all_words 
-                if (any(letter in word for letter in diff_letters) and
-                    len(set(word)) == 5)]  # Prefer unique letters
+        return self._distinguish_cache[pair]
     
     def find_best_guess(self) -> Optional[str]:
         """Find the optimal next guess"""
-        if not self.possible_words:
+        if len(self._history_key) >= OPENING_CACHE_PLIES:
+            return self._search_best_guess()
+        
+        if self._history_key not in self._opening_cache:
+            self._opening_cache[self._history_key] = self._search_best_guess()
+        return self._opening_cache[self._history_key]
+    
+    def _search_best_guess(self) -> Optional[str]:
+        """Score the guess pool for the current game state"""
+        if len(self.possible_idx) == 0:
             return None
         
-        if len(self.possible_words) == 1:
-            return self.possible_words[0]
+        if len(self.possible_idx) == 1:
+            return self.all_words[self.possible_idx[0]]
         
         # Choose guess pool based on game state
-        if len(self.possible_words) > 50:
-            guess_pool = self.all_words[:1000]  # Limit for performance
-        elif len(self.possible_words) > 2:
-            guess_pool = self.all_words
+        if len(self.possible_idx) > 50:
+            guess_pool = np.arange(min(1000, len(self.all_words)))  # Limit for performance
+        elif len(self.possible_idx) > 2:
+            guess_pool = np.arange(len(self.all_words))
         else:
             guess_pool = self.find_distinguishing_words()
-            if not guess_pool:
-                return self.possible_words[0]
+            if len(guess_pool) == 0:
+                return self.all_words[self.possible_idx[0]]
+        
+        # No guess can leave fewer than one word expected or test more than
+        # five new letters, so a guess reaching this score cannot be beaten
+        untested = bin(self.tested_mask ^ ALL_LETTERS).count('1')
+        score_ceiling = len(self.possible_idx) - 1 + 2 * min(5, untested)
         
+        # Score the pool in slices, stopping at the first slice that reaches
+        # the ceiling; argmax keeps the first of equal scores
         best_guess = None
         best_score = -1
+        for start in range(0, len(guess_pool), EARLY_EXIT_SLICE):
+            pool_slice = guess_pool[start:start + EARLY_EXIT_SLICE]
+            scores = self.score_guesses(pool_slice)
+            best = int(np.argmax(scores))
+            if scores[best] > best_score:
+                best_score = scores[best]
+                best_guess = pool_slice[best]
+            if best_score >= score_ceiling:
+                break
         
-        for guess in guess_pool:
-            score = self.calculate_expected_value(guess)
-            if score > best_score:
-                best_score = score
-                best_guess = guess
-        
-        return best_guess or self.possible_words[0]
+        if best_guess is None:
+            return self.all_words[self.possible_idx[0]]
+        return self.all_words[best_guess]
     
     def make_guess(self, guess: str, result: List[str]):
         """Process a guess and its result"""
         self.guess_history.append((guess, result))
         self.update_letter_tracking(guess, result)
         
-        # Filter possible words
-        self.possible_words = [
-            word for word in self.possible_words
-            if self.is_word_compatible(word, guess, result)
-        ]
+        # Keep the words that would have given exactly this result
+        guess_idx = self.word_index.get(guess)
+        if guess_idx is not None:
+            self._ensure_rows(np.array([guess_idx]))
+            codes = self.pattern_matrix[guess_idx, self.possible_idx]
+        else:
+            guess_u8 = np.frombuffer(guess.encode('ascii'), dtype=np.uint8).reshape(1, 5)
+            codes = pattern_codes(guess_u8, self.words_u8[self.possible_idx],
+                                  self.letter_counts[self.possible_idx])[0]
+        code = encode_pattern(result)
+        self.possible_idx = self.possible_idx[codes == code]
+        self._history_key += ((guess, code),)
     
     def solve_word(self, target_word: str, max_guesses: int = 6) -> Dict:
         """Solve a specific word and return metrics"""
@@ -201,15 +370,6 @@ class WordleSolver:
         guesses = []
         
         for guess_num in range(max_guesses):
-            if len(self.possible_words) == 1 and self.possible_words[0] == target_word:
-                # Found the answer
-                return {
-                    'success': True,
-                    'guesses': guess_num,
-                    'guess_history': guesses,
-                    'final_words_remaining': 1
-                }
-            
             best_guess = self.find_best_guess()
             if not best_guess:
                 break
@@ -226,23 +386,103 @@ class WordleSolver:
                 }
             
             self.make_guess(best_guess, result)
+            
+            if (guess_num + 1 < max_guesses and len(self.possible_idx) == 1
+                    and self.all_words[self.possible_idx[0]] == target_word):
+                # Found the answer
+                return {
+                    'success': True,
+                    'guesses': guess_num + 1,
+                    'guess_history': guesses,
+                    'final_words_remaining': 1
+                }
         
         return {
             'success': False,
             'guesses': max_guesses,
             'guess_history': guesses,
-            'final_words_remaining': len(self.possible_words)
+            'final_words_remaining': len(self.possible_idx)
         }
 
 
+# Per-process solver used by the pool workers in solve_words_parallel
+_worker_solver = None
+_worker_shm = None
+
+def _workers_fork() -> bool:
+    """Whether pool workers are forked, inheriting the parent's memory copy-on-write"""
+    return get_start_method() == 'fork'
+
+def _init_forked_worker(word_list: List[str], pattern_matrix: np.ndarray):
+    global _worker_solver
+    _worker_solver = WordleSolver(word_list, pattern_matrix=pattern_matrix)
+
+def _init_shm_worker(word_list: List[str], shm_name: str, shape: Tuple[int, int]):
+    global _worker_solver, _worker_shm
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    pattern_matrix = np.ndarray(shape, dtype=np.uint8, buffer=_worker_shm.buf)
+    pattern_matrix.flags.writeable = False
+    _worker_solver = WordleSolver(word_list, pattern_matrix=pattern_matrix)
+
+def _init_file_worker(word_list: List[str], matrix_path: str):
+    global _worker_solver
+    # The parent has already filled in every row, so this only reads the file
+    _worker_solver = WordleSolver(word_list, matrix_path=matrix_path)
+
+def _solve_target(word: str) -> Dict:
+    result = _worker_solver.solve_word(word)
+    result['target_word'] = word
+    return result
+
+def solve_words_parallel(solver: WordleSolver, test_words: List[str], processes: Optional[int] = None, chunksize: int = 32):
+    """Solve each test word across a process pool, yielding results in test_words order
+    
+    The workers share the solver's pattern matrix instead of each precomputing
+    their own. Forked workers inherit it copy-on-write. Otherwise they attach
+    to it in shared memory: a solver built with share_matrix already has it
+    there, any other is copied there. A file-backed matrix is completed here
+    first and then mapped by every worker directly.
+    """
+    def run(initializer, initargs):
+        with Pool(processes or os.cpu_count(), initializer=initializer, initargs=initargs) as pool:
+            yield from pool.imap(_solve_target, test_words, chunksize=chunksize)
+    
+    if solver.matrix_path is not None:
+        solver._ensure_rows(np.arange(len(solver.all_words)))
+        solver.pattern_matrix.flush()
+        yield from run(_init_file_worker, (solver.all_words, solver.matrix_path))
+        return
+    
+    matrix = solver.pattern_matrix
+    if _workers_fork():
+        yield from run(_init_forked_worker, (solver.all_words, matrix))
+        return
+    
+    shm = solver._shm
+    copied = shm is None
+    if copied:
+        shm = shared_memory.SharedMemory(create=True, size=max(matrix.nbytes, 1))
+    try:
+        if copied:
+            np.ndarray(matrix.shape, dtype=np.uint8, buffer=shm.buf)[:] = matrix
+        yield from run(_init_shm_worker, (solver.all_words, shm.name, matrix.shape))
+    finally:
+        if copied:
+            shm.close()
+            shm.unlink()
+
+
 class WordleTestSuite:
-    def __init__(self, word_file: str = '../words.txt'):
-        """Initialize the test suite"""
-        with open(word_file, 'r') as f:
-            self.word_list = [line.strip().upper() for line in f 
-                            if len(line.strip()) == 5]
+    def __init__(self, word_file: str = '../words.txt', matrix_path: Optional[str] = None):
+        """Initialize the test suite
+        
+        matrix_path keeps the solver's pattern matrix in that file rather than in memory.
+        """
+        self.word_list = [sys.intern(word) for word in load_word_list(word_file)]
         
-        self.solver = WordleSolver(self.word_list)
+        # Only workers that aren't forked need the matrix in shared memory
+        self.solver = WordleSolver(self.word_list, matrix_path=matrix_path,
+                                   share_matrix=not _workers_fork())
         self.results = []
         
         print(f"Loaded {len(self.word_list)} words for testing")
@@ -257,7 +497,7 @@ class WordleTestSuite:
         
         results = []
         
-        for i, word in enumerate(test_words):
+        for i, result in enumerate(solve_words_parallel(self.solver, test_words, chunksize=64)):
             if i % 500 == 0 and i > 0:
                 elapsed = time.time() - start_time
                 rate = i / elapsed
@@ -265,8 +505,6 @@ class WordleTestSuite:
                 print(f"Progress: {i:,}/{len(test_words):,} ({i/len(test_words)*100:.1f}%) "
                       f"- Rate: {rate:.1f} words/sec - ETA: {eta/60:.1f} min")
             
-            result = self.solver.solve_word(word)
-            result['target_word'] = word
             results.append(result)
         
         self.results = results
@@ -287,22 +525,21 @@ class WordleTestSuite:
         guess_counts = [r['guesses'] for r in successful_games]
         all_guess_counts = [r['guesses'] for r in self.results]  # Include failures
         
-        # Calculate comprehensive statistics
-        def safe_stat(func, data, default=0):
-            try:
-                return func(data) if data else default
-            except:
-                return default
+        # Calculate comprehensive statistics with single-pass NumPy reductions
+        gc = np.asarray(guess_counts, dtype=np.int64)
+        all_gc = np.asarray(all_guess_counts, dtype=np.int64)
+        solved_in = np.bincount(gc, minlength=7)
         
         # Percentiles for successful games
         percentiles = {}
+        q1 = q3 = 0
         if guess_counts:
-            for p in [10, 25, 50, 75, 90, 95, 99]:
-                percentiles[f'p{p}'] = np.percentile(guess_counts, p)
+            ranks = [10, 25, 50, 75, 90, 95, 99]
+            pct_vals = np.percentile(gc, ranks)
+            percentiles = {f'p{p}': value for p, value in zip(ranks, pct_vals)}
+            q1, q3 = pct_vals[1], pct_vals[3]
         
         # IQR calculation
-        q1 = percentiles.get('p25', 0)
-        q3 = percentiles.get('p75', 0)
         iqr = q3 - q1
         
         analysis = {
@@ -313,19 +550,19 @@ class WordleTestSuite:
             
             'guess_statistics': {
                 # Central Tendency
-                'mean': safe_stat(statistics.mean, guess_counts),
-                'median': safe_stat(statistics.median, guess_counts),
-                'mode': safe_stat(statistics.mode, guess_counts),
+                'mean': float(gc.mean()) if gc.size else 0,
+                'median': float(np.median(gc)) if gc.size else 0,
+                'mode': int(solved_in.argmax()) if gc.size else 0,
                 
                 # Variability
-                'std_dev': safe_stat(statistics.stdev, guess_counts) if len(guess_counts) > 1 else 0,
-                'variance': safe_stat(statistics.variance, guess_counts) if len(guess_counts) > 1 else 0,
-                'range': max(guess_counts) - min(guess_counts) if guess_counts else 0,
+                'std_dev': float(gc.std(ddof=1)) if gc.size > 1 else 0,
+                'variance': float(gc.var(ddof=1)) if gc.size > 1 else 0,
+                'range': int(gc.max() - gc.min()) if gc.size else 0,
                 'iqr': iqr,
                 
                 # Extremes
-                'min': min(guess_counts) if guess_counts else 0,
-                'max': max(guess_counts) if guess_counts else 0,
+                'min': int(gc.min()) if gc.size else 0,
+                'max': int(gc.max()) if gc.size else 0,
                 'q1': q1,
                 'q3': q3,
                 
@@ -333,22 +570,22 @@ class WordleTestSuite:
                 'percentiles': percentiles,
                 
                 # Shape of distribution
-                'skewness': self._calculate_skewness(guess_counts),
-                'kurtosis': self._calculate_kurtosis(guess_counts),
+                'skewness': self._calculate_skewness(gc),
+                'kurtosis': self._calculate_kurtosis(gc),
             },
             
-            'guess_distribution': dict(Counter(guess_counts)),
-            'all_games_distribution': dict(Counter(all_guess_counts)),  # Include failures at 6
+            'guess_distribution': self._value_counts(gc),
+            'all_games_distribution': self._value_counts(all_gc),  # Include failures at 6
             
             'detailed_analysis': {
-                'words_solved_in_1': len([g for g in guess_counts if g == 1]),
-                'words_solved_in_2': len([g for g in guess_counts if g == 2]),
-                'words_solved_in_3': len([g for g in guess_counts if g == 3]),
-                'words_solved_in_4': len([g for g in guess_counts if g == 4]),
-                'words_solved_in_5': len([g for g in guess_counts if g == 5]),
-                'words_solved_in_6': len([g for g in guess_counts if g == 6]),
-                'percentage_under_4': len([g for g in guess_counts if g <= 3]) / len(guess_counts) * 100 if guess_counts else 0,
-                'percentage_under_5': len([g for g in guess_counts if g <= 4]) / len(guess_counts) * 100 if guess_counts else 0,
+                'words_solved_in_1': int(solved_in[1]),
+                'words_solved_in_2': int(solved_in[2]),
+                'words_solved_in_3': int(solved_in[3]),
+                'words_solved_in_4': int(solved_in[4]),
+                'words_solved_in_5': int(solved_in[5]),
+                'words_solved_in_6': int(solved_in[6]),
+                'percentage_under_4': int(solved_in[:4].sum()) / gc.size * 100 if gc.size else 0,
+                'percentage_under_5': int(solved_in[:5].sum()) / gc.size * 100 if gc.size else 0,
             },
             
             'failure_analysis': {
@@ -370,31 +607,28 @@ class WordleTestSuite:
         
         return analysis
 
-    def _calculate_skewness(self, data):
+    def _value_counts(self, data: np.ndarray) -> Dict[int, int]:
+        """Count how often each value occurs"""
+        values, counts = np.unique(data, return_counts=True)
+        return dict(zip(values.tolist(), counts.tolist()))
+
+    def _calculate_skewness(self, data: np.ndarray):
         """Calculate skewness of the distribution"""
         if len(data) < 3:
             return 0
-        try:
-            mean = statistics.mean(data)
-            std = statistics.stdev(data)
-            n = len(data)
-            skew = sum(((x - mean) / std) ** 3 for x in data) / n
-            return skew
-        except:
+        std = data.std(ddof=1)
+        if std == 0:
             return 0
+        return float((((data - data.mean()) / std) ** 3).mean())
 
-    def _calculate_kurtosis(self, data):
+    def _calculate_kurtosis(self, data: np.ndarray):
         """Calculate kurtosis of the distribution"""
         if len(data) < 4:
             return 0
-        try:
-            mean = statistics.mean(data)
-            std = statistics.stdev(data)
-            n = len(data)
-            kurt = sum(((x - mean) / std) ** 4 for x in data) / n - 3  # Excess kurtosis
-            return kurt
-        except:
+        std = data.std(ddof=1)
+        if std == 0:
             return 0
+        return float((((data - data.mean()) / std) ** 4).mean() - 3)  # Excess kurtosis
     
     def generate_visualizations(self, save_dir: str = './'):
         """Generate comprehensive visualizations"""
@@ -630,14 +864,14 @@ Key strengths:
         return report
 
 
-def main():
+def main(matrix_path: Optional[str] = None):
     """Run the EXHAUSTIVE Wordle algorithm test suite"""
     print("EXHAUSTIVE WORDLE ALGORITHM TESTING SUITE")
     print("=" * 55)
     print("Testing on ALL words in dictionary for complete statistical coverage")
     
     # Initialize test suite
-    tester = WordleTestSuite()
+    tester = WordleTestSuite(matrix_path=matrix_path)
     
     # Run EXHAUSTIVE tests on all words
     print("\nRunning EXHAUSTIVE performance tests...")
@@ -674,4 +908,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    # An optional argument names a file to keep the pattern matrix in
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
\ No newline at end of file